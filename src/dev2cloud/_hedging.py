@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Optional
+
+_MIN_SAMPLES = 10
+_WINDOW = 200
+
+
+class LatencyTracker:
+    """Rolling window of read latencies used to pick the hedge delay."""
+
+    def __init__(self, percentile: float) -> None:
+        if not 0 < percentile < 1:
+            raise ValueError("hedge_percentile must be between 0 and 1")
+        self.percentile = percentile
+        self._samples: deque[float] = deque(maxlen=_WINDOW)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def hedge_delay(self) -> Optional[float]:
+        """Return the current latency percentile, or ``None`` while the
+        window holds too few samples to hedge reliably."""
+        with self._lock:
+            if len(self._samples) < _MIN_SAMPLES:
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+        return ordered[index]
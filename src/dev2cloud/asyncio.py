@@ -2,21 +2,42 @@ from __future__ import annotations
 
 import asyncio as _asyncio
 import os
+import threading
 import time
+from typing import Any
 
 import httpx
 
+from dev2cloud._hedging import LatencyTracker
 from dev2cloud.exceptions import Dev2CloudApiError
 from dev2cloud.models import Sandbox, SandboxStatus, SandboxType
 
 
 class Dev2Cloud:
-    """Async client for the Dev2Cloud sandbox management API."""
+    """Async client for the Dev2Cloud sandbox management API.
+
+    The HTTP transport is created lazily and rebuilt in a child process
+    after ``os.fork()``, so an instance can be shared with
+    ``multiprocessing`` workers.  Pickling keeps only the configuration.
+
+    Args:
+        api_key: API key. Falls back to the ``D2C_API_KEY`` environment
+            variable.
+        base_url: Base URL of the Dev2Cloud API.
+        hedge_percentile: Enables request hedging for idempotent reads
+            (``get_sandbox`` and ``list_sandboxes``). When a read takes
+            longer than this percentile of recently observed latencies
+            for that endpoint (e.g. ``0.95``), a second identical request
+            is sent and whichever answers first wins; the slower one is
+            cancelled. Disabled by default.
+    """
 
     def __init__(
         self,
         api_key: str | None = None,
         base_url: str = "https://api.dev2.cloud",
+        *,
+        hedge_percentile: float | None = None,
     ) -> None:
         resolved_key = api_key or os.environ.get("D2C_API_KEY")
         if not resolved_key:
@@ -25,12 +46,61 @@ class Dev2Cloud:
                 "API key is required. Pass it directly or set the D2C_API_KEY environment variable.",
             )
 
+        self._api_key = resolved_key
+        self._base_url = base_url.rstrip("/")
+        self._hedge_percentile = hedge_percentile
         self._sandboxes_path = "/api/v1/sandboxes"
-        self._client = httpx.AsyncClient(
-            base_url=base_url.rstrip("/"),
-            headers={"X-Api-Key": resolved_key},
+        self._reset_transport()
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            "api_key": self._api_key,
+            "base_url": self._base_url,
+            "hedge_percentile": self._hedge_percentile,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._api_key = state["api_key"]
+        self._base_url = state["base_url"]
+        self._hedge_percentile = state["hedge_percentile"]
+        self._sandboxes_path = "/api/v1/sandboxes"
+        self._reset_transport()
+
+    def _reset_transport(self) -> None:
+        """Drop per-process state so it is rebuilt on next use.
+
+        Called on construction and in a child process after ``fork()``:
+        the parent's connection pool must not be reused there.  The lock
+        guarding lazy creation is replaced too, so a child never inherits
+        one held by another thread.
+        """
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._http: httpx.AsyncClient | None = None
+        self._latency: dict[str, LatencyTracker] = (
+            {
+                "get": LatencyTracker(self._hedge_percentile),
+                "list": LatencyTracker(self._hedge_percentile),
+            }
+            if self._hedge_percentile is not None
+            else {}
         )
 
+    def _check_fork(self) -> None:
+        if self._pid != os.getpid():
+            self._reset_transport()
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        self._check_fork()
+        with self._lock:
+            if self._http is None:
+                self._http = httpx.AsyncClient(
+                    base_url=self._base_url,
+                    headers={"X-Api-Key": self._api_key},
+                )
+            return self._http
+
     @staticmethod
     def _raise_on_error(response: httpx.Response) -> None:
         if response.is_success:
@@ -41,6 +111,82 @@ class Dev2Cloud:
             detail = response.text
         raise Dev2CloudApiError(response.status_code, detail)
 
+    @staticmethod
+    def _deadline(timeout: float | None) -> float | None:
+        return None if timeout is None else time.monotonic() + timeout
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        deadline: float | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request that is cancelled once *deadline* passes."""
+        if deadline is None:
+            return await self._client.request(method, url, **kwargs)
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise Dev2CloudApiError(0, f"Deadline exceeded before {method} {url}")
+        try:
+            return await _asyncio.wait_for(
+                self._client.request(method, url, timeout=remaining, **kwargs),
+                remaining,
+            )
+        except (httpx.TimeoutException, _asyncio.TimeoutError) as exc:
+            raise Dev2CloudApiError(0, f"Deadline exceeded during {method} {url}") from exc
+
+    async def _timed_get(
+        self, url: str, deadline: float | None, tracker: LatencyTracker
+    ) -> httpx.Response:
+        start = time.monotonic()
+        response = await self._request("GET", url, deadline=deadline)
+        tracker.record(time.monotonic() - start)
+        return response
+
+    async def _get(
+        self, url: str, deadline: float | None, endpoint: str
+    ) -> httpx.Response:
+        """GET *url*, hedging with a second attempt when it runs slow.
+
+        Latencies are tracked per *endpoint* so that fast single-sandbox
+        reads do not set the hedge delay for slower listings.
+        """
+        self._check_fork()
+        tracker = self._latency.get(endpoint)
+        if tracker is None:
+            return await self._request("GET", url, deadline=deadline)
+        delay = tracker.hedge_delay()
+        if delay is None:
+            return await self._timed_get(url, deadline, tracker)
+
+        attempts = {_asyncio.ensure_future(self._timed_get(url, deadline, tracker))}
+        try:
+            done, _ = await _asyncio.wait(attempts, timeout=delay)
+            if not done:
+                attempts.add(
+                    _asyncio.ensure_future(self._timed_get(url, deadline, tracker))
+                )
+
+            error: BaseException | None = None
+            pending = attempts
+            while pending:
+                done, pending = await _asyncio.wait(
+                    pending, return_when=_asyncio.FIRST_COMPLETED
+                )
+                for attempt in done:
+                    exc = attempt.exception()
+                    if exc is None:
+                        return attempt.result()
+                    error = exc
+            assert error is not None
+            raise error
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+
     async def create_sandbox(
         self,
         sandbox_type: SandboxType,
@@ -52,7 +198,8 @@ class Dev2Cloud:
 
         Provisions a sandbox of the given *sandbox_type* and polls its
         status every second until it transitions to ``running`` or
-        ``failed``.
+        ``failed``.  *timeout* is an end-to-end deadline: it bounds the
+        create request, every poll request and the waits in between.
 
         When *name* is provided the endpoint behaves as **get-or-create**:
         if a running or pending sandbox with the same name already exists
@@ -63,7 +210,7 @@ class Dev2Cloud:
         Args:
             sandbox_type: ``"postgres"`` or ``"redis"``.
             name: Optional name for get-or-create semantics.
-            timeout: Maximum seconds to wait. Defaults to 180.
+            timeout: Maximum seconds for the whole call. Defaults to 180.
 
         Returns:
             The sandbox with ``running`` status and connection credentials.
@@ -71,8 +218,11 @@ class Dev2Cloud:
         Raises:
             Dev2CloudApiError: On API errors, provision failure, or timeout.
         """
-        response = await self._client.post(
+        deadline = time.monotonic() + timeout
+        response = await self._request(
+            "POST",
             self._sandboxes_path,
+            deadline=deadline,
             json={"sandbox_type": sandbox_type, "name": name},
         )
         self._raise_on_error(response)
@@ -86,72 +236,107 @@ class Dev2Cloud:
         if initial.status != SandboxStatus.PENDING:
             return initial
 
-        deadline = time.monotonic() + timeout
         while True:
+            await _asyncio.sleep(max(0.0, min(1.0, deadline - time.monotonic())))
             if time.monotonic() >= deadline:
                 raise Dev2CloudApiError(
                     0,
                     f"Sandbox {sandbox_id} did not become ready within {timeout}s",
                 )
-            await _asyncio.sleep(1)
-            sandbox = await self.get_sandbox(sandbox_id)
+            sandbox = await self._get_sandbox(sandbox_id, deadline)
             if sandbox.status == SandboxStatus.FAILED:
                 raise Dev2CloudApiError(0, f"Sandbox {sandbox_id} failed to provision")
             if sandbox.status != SandboxStatus.PENDING:
                 return sandbox
 
-    async def get_sandbox(self, sandbox_id: str) -> Sandbox:
+    async def _get_sandbox(self, sandbox_id: str, deadline: float | None) -> Sandbox:
+        response = await self._get(
+            f"{self._sandboxes_path}/{sandbox_id}", deadline, "get"
+        )
+        self._raise_on_error(response)
+        return Sandbox(**response.json())
+
+    async def _list_sandboxes(self, deadline: float | None) -> list[Sandbox]:
+        response = await self._get(self._sandboxes_path, deadline, "list")
+        self._raise_on_error(response)
+        return [Sandbox(**item) for item in response.json()]
+
+    async def _delete_sandbox(self, sandbox_id: str, deadline: float | None) -> None:
+        response = await self._request(
+            "DELETE", f"{self._sandboxes_path}/{sandbox_id}", deadline=deadline
+        )
+        self._raise_on_error(response)
+
+    async def get_sandbox(
+        self, sandbox_id: str, *, timeout: float | None = None
+    ) -> Sandbox:
         """Get a sandbox by its ID.
 
         Args:
             sandbox_id: Unique identifier of the sandbox.
+            timeout: Optional maximum seconds for the whole call,
+                including any hedged attempt.
 
         Raises:
-            Dev2CloudError: If the API returns an error response.
+            Dev2CloudApiError: If the API returns an error response or
+                the deadline is exceeded.
         """
-        response = await self._client.get(f"{self._sandboxes_path}/{sandbox_id}")
-        self._raise_on_error(response)
-        return Sandbox(**response.json())
+        return await self._get_sandbox(sandbox_id, self._deadline(timeout))
 
-    async def list_sandboxes(self) -> list[Sandbox]:
+    async def list_sandboxes(self, *, timeout: float | None = None) -> list[Sandbox]:
         """List all active sandboxes for the authenticated user.
 
+        Args:
+            timeout: Optional maximum seconds for the whole call,
+                including any hedged attempt.
+
         Raises:
-            Dev2CloudError: If the API returns an error response.
+            Dev2CloudApiError: If the API returns an error response or
+                the deadline is exceeded.
         """
-        response = await self._client.get(self._sandboxes_path)
-        self._raise_on_error(response)
-        return [Sandbox(**item) for item in response.json()]
+        return await self._list_sandboxes(self._deadline(timeout))
 
-    async def delete_sandbox(self, sandbox_id: str) -> None:
+    async def delete_sandbox(
+        self, sandbox_id: str, *, timeout: float | None = None
+    ) -> None:
         """Permanently delete a sandbox.
 
         Connection credentials are revoked immediately.
 
         Args:
             sandbox_id: Unique identifier of the sandbox to delete.
+            timeout: Optional maximum seconds for the whole call.
 
         Raises:
-            Dev2CloudError: If the API returns an error response.
+            Dev2CloudApiError: If the API returns an error response or
+                the deadline is exceeded.
         """
-        response = await self._client.delete(f"{self._sandboxes_path}/{sandbox_id}")
-        self._raise_on_error(response)
+        await self._delete_sandbox(sandbox_id, self._deadline(timeout))
 
-    async def delete_all(self) -> list[str]:
+    async def delete_all(self, *, timeout: float | None = None) -> list[str]:
         """Delete all active sandboxes.
 
         Individual deletion errors are silently ignored so that one
         failure does not prevent the remaining sandboxes from being
         removed.
 
+        Args:
+            timeout: Optional maximum seconds for the whole call, shared
+                by the listing and every deletion.
+
         Returns:
             IDs of successfully deleted sandboxes.
+
+        Raises:
+            Dev2CloudApiError: If listing fails or the deadline is
+                exceeded before the listing completes.
         """
-        sandboxes = await self.list_sandboxes()
+        deadline = self._deadline(timeout)
+        sandboxes = await self._list_sandboxes(deadline)
         deleted: list[str] = []
         for sb in sandboxes:
             try:
-                await self.delete_sandbox(sb.id)
+                await self._delete_sandbox(sb.id, deadline)
                 deleted.append(sb.id)
             except Dev2CloudApiError:
                 pass
@@ -1,21 +1,43 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
+from concurrent.futures import Future, as_completed, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable
 
 import httpx
 
+from dev2cloud._hedging import LatencyTracker
 from dev2cloud.exceptions import Dev2CloudApiError
 from dev2cloud.models import Sandbox, SandboxStatus, SandboxType
 
 
 class Dev2Cloud:
-    """Sync client for the Dev2Cloud sandbox management API."""
+    """Sync client for the Dev2Cloud sandbox management API.
+
+    The HTTP transport is created lazily and rebuilt in a child process
+    after ``os.fork()``, so an instance can be shared with
+    ``multiprocessing`` workers.  Pickling keeps only the configuration.
+
+    Args:
+        api_key: API key. Falls back to the ``D2C_API_KEY`` environment
+            variable.
+        base_url: Base URL of the Dev2Cloud API.
+        hedge_percentile: Enables request hedging for idempotent reads
+            (``get_sandbox`` and ``list_sandboxes``). When a read takes
+            longer than this percentile of recently observed latencies
+            for that endpoint (e.g. ``0.95``), a second identical request
+            is sent and whichever answers first wins. Disabled by default.
+    """
 
     def __init__(
         self,
         api_key: str | None = None,
         base_url: str = "https://api.dev2.cloud",
+        *,
+        hedge_percentile: float | None = None,
     ) -> None:
         resolved_key = api_key or os.environ.get("D2C_API_KEY")
         if not resolved_key:
@@ -24,12 +46,82 @@ class Dev2Cloud:
                 "API key is required. Pass it directly or set the D2C_API_KEY environment variable.",
             )
 
+        self._api_key = resolved_key
+        self._base_url = base_url.rstrip("/")
+        self._hedge_percentile = hedge_percentile
+        self._sandboxes_path = "/api/v1/sandboxes"
+        self._reset_transport()
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            "api_key": self._api_key,
+            "base_url": self._base_url,
+            "hedge_percentile": self._hedge_percentile,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._api_key = state["api_key"]
+        self._base_url = state["base_url"]
+        self._hedge_percentile = state["hedge_percentile"]
         self._sandboxes_path = "/api/v1/sandboxes"
-        self._client = httpx.Client(
-            base_url=base_url.rstrip("/"),
-            headers={"X-Api-Key": resolved_key},
+        self._reset_transport()
+
+    def _reset_transport(self) -> None:
+        """Drop per-process state so it is rebuilt on next use.
+
+        Called on construction and in a child process after ``fork()``:
+        the parent's connection pool must not be reused there.  The lock
+        guarding lazy creation is replaced too, so a child never inherits
+        one held by another thread.
+        """
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._http: httpx.Client | None = None
+        self._latency: dict[str, LatencyTracker] = (
+            {
+                "get": LatencyTracker(self._hedge_percentile),
+                "list": LatencyTracker(self._hedge_percentile),
+            }
+            if self._hedge_percentile is not None
+            else {}
         )
 
+    def _check_fork(self) -> None:
+        if self._pid != os.getpid():
+            self._reset_transport()
+
+    @property
+    def _client(self) -> httpx.Client:
+        self._check_fork()
+        with self._lock:
+            if self._http is None:
+                self._http = httpx.Client(
+                    base_url=self._base_url,
+                    headers={"X-Api-Key": self._api_key},
+                )
+            return self._http
+
+    @staticmethod
+    def _in_thread(
+        fn: Callable[..., httpx.Response], *args: Any, **kwargs: Any
+    ) -> Future[httpx.Response]:
+        """Run *fn* on a dedicated daemon thread.
+
+        Every deadline-bound request and hedge attempt gets its own thread
+        so none of them can queue behind another and spend its budget
+        waiting.  The thread itself stops at the request's deadline.
+        """
+        future: Future[httpx.Response] = Future()
+
+        def run() -> None:
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+        threading.Thread(target=run, name="dev2cloud-request", daemon=True).start()
+        return future
+
     @staticmethod
     def _raise_on_error(response: httpx.Response) -> None:
         if response.is_success:
@@ -40,6 +132,110 @@ class Dev2Cloud:
             detail = response.text
         raise Dev2CloudApiError(response.status_code, detail)
 
+    @staticmethod
+    def _deadline(timeout: float | None) -> float | None:
+        return None if timeout is None else time.monotonic() + timeout
+
+    def _send(
+        self, method: str, url: str, deadline: float | None, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request in the calling thread.
+
+        With a *deadline* the body is streamed and the request abandoned
+        as soon as the deadline passes, since httpx applies its own
+        timeout to each phase and socket read rather than to the whole
+        exchange.
+        """
+        if deadline is None:
+            return self._client.request(method, url, **kwargs)
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise Dev2CloudApiError(0, f"Deadline exceeded before {method} {url}")
+        try:
+            with self._client.stream(method, url, timeout=remaining, **kwargs) as response:
+                body = bytearray()
+                for chunk in response.iter_bytes():
+                    body += chunk
+                    if time.monotonic() >= deadline:
+                        raise Dev2CloudApiError(
+                            0, f"Deadline exceeded during {method} {url}"
+                        )
+        except httpx.TimeoutException as exc:
+            raise Dev2CloudApiError(0, f"Deadline exceeded during {method} {url}") from exc
+        headers = response.headers.copy()
+        headers.pop("Content-Encoding", None)
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=bytes(body),
+            request=response.request,
+        )
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        deadline: float | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request that never outlives *deadline*."""
+        if deadline is None:
+            return self._send(method, url, None, **kwargs)
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise Dev2CloudApiError(0, f"Deadline exceeded before {method} {url}")
+        future = self._in_thread(self._send, method, url, deadline, **kwargs)
+        try:
+            return future.result(timeout=remaining)
+        except FutureTimeoutError as exc:
+            raise Dev2CloudApiError(0, f"Deadline exceeded during {method} {url}") from exc
+
+    def _timed_send(
+        self, url: str, deadline: float | None, tracker: LatencyTracker
+    ) -> httpx.Response:
+        start = time.monotonic()
+        response = self._send("GET", url, deadline)
+        tracker.record(time.monotonic() - start)
+        return response
+
+    def _get(self, url: str, deadline: float | None, endpoint: str) -> httpx.Response:
+        """GET *url*, hedging with a second attempt when it runs slow.
+
+        Latencies are tracked per *endpoint* so that fast single-sandbox
+        reads do not set the hedge delay for slower listings.
+        """
+        self._check_fork()
+        tracker = self._latency.get(endpoint)
+        if tracker is None:
+            return self._request("GET", url, deadline=deadline)
+        delay = tracker.hedge_delay()
+        if delay is None:
+            start = time.monotonic()
+            response = self._request("GET", url, deadline=deadline)
+            tracker.record(time.monotonic() - start)
+            return response
+
+        attempts = [self._in_thread(self._timed_send, url, deadline, tracker)]
+        done, _ = wait(attempts, timeout=delay)
+        if not done:
+            attempts.append(self._in_thread(self._timed_send, url, deadline, tracker))
+
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        error: BaseException | None = None
+        try:
+            for attempt in as_completed(attempts, timeout=remaining):
+                try:
+                    return attempt.result()
+                except Exception as exc:
+                    error = exc
+        except FutureTimeoutError as exc:
+            raise Dev2CloudApiError(0, f"Deadline exceeded during GET {url}") from exc
+        assert error is not None
+        raise error
+
     def create_sandbox(
         self,
         sandbox_type: SandboxType,
@@ -51,7 +247,8 @@ class Dev2Cloud:
 
         Provisions a sandbox of the given *sandbox_type* and polls its
         status every second until it transitions to ``running`` or
-        ``failed``.
+        ``failed``.  *timeout* is an end-to-end deadline: it bounds the
+        create request, every poll request and the waits in between.
 
         When *name* is provided the endpoint behaves as **get-or-create**:
         if a running or pending sandbox with the same name already exists
@@ -62,7 +259,7 @@ class Dev2Cloud:
         Args:
             sandbox_type: ``"postgres"`` or ``"redis"``.
             name: Optional name for get-or-create semantics.
-            timeout: Maximum seconds to wait. Defaults to 180.
+            timeout: Maximum seconds for the whole call. Defaults to 180.
 
         Returns:
             The sandbox with ``running`` status and connection credentials.
@@ -70,8 +267,11 @@ class Dev2Cloud:
         Raises:
             Dev2CloudApiError: On API errors, provision failure, or timeout.
         """
-        response = self._client.post(
+        deadline = time.monotonic() + timeout
+        response = self._request(
+            "POST",
             self._sandboxes_path,
+            deadline=deadline,
             json={"sandbox_type": sandbox_type, "name": name},
         )
         self._raise_on_error(response)
@@ -85,72 +285,101 @@ class Dev2Cloud:
         if initial.status != SandboxStatus.PENDING:
             return initial
 
-        deadline = time.monotonic() + timeout
         while True:
+            time.sleep(max(0.0, min(1.0, deadline - time.monotonic())))
             if time.monotonic() >= deadline:
                 raise Dev2CloudApiError(
                     0,
                     f"Sandbox {sandbox_id} did not become ready within {timeout}s",
                 )
-            time.sleep(1)
-            sandbox = self.get_sandbox(sandbox_id)
+            sandbox = self._get_sandbox(sandbox_id, deadline)
             if sandbox.status == SandboxStatus.FAILED:
                 raise Dev2CloudApiError(0, f"Sandbox {sandbox_id} failed to provision")
             if sandbox.status != SandboxStatus.PENDING:
                 return sandbox
 
-    def get_sandbox(self, sandbox_id: str) -> Sandbox:
+    def _get_sandbox(self, sandbox_id: str, deadline: float | None) -> Sandbox:
+        response = self._get(f"{self._sandboxes_path}/{sandbox_id}", deadline, "get")
+        self._raise_on_error(response)
+        return Sandbox(**response.json())
+
+    def _list_sandboxes(self, deadline: float | None) -> list[Sandbox]:
+        response = self._get(self._sandboxes_path, deadline, "list")
+        self._raise_on_error(response)
+        return [Sandbox(**item) for item in response.json()]
+
+    def _delete_sandbox(self, sandbox_id: str, deadline: float | None) -> None:
+        response = self._request(
+            "DELETE", f"{self._sandboxes_path}/{sandbox_id}", deadline=deadline
+        )
+        self._raise_on_error(response)
+
+    def get_sandbox(self, sandbox_id: str, *, timeout: float | None = None) -> Sandbox:
         """Get a sandbox by its ID.
 
         Args:
             sandbox_id: Unique identifier of the sandbox.
+            timeout: Optional maximum seconds for the whole call,
+                including any hedged attempt.
 
         Raises:
-            Dev2CloudApiError: If the API returns an error response.
+            Dev2CloudApiError: If the API returns an error response or
+                the deadline is exceeded.
         """
-        response = self._client.get(f"{self._sandboxes_path}/{sandbox_id}")
-        self._raise_on_error(response)
-        return Sandbox(**response.json())
+        return self._get_sandbox(sandbox_id, self._deadline(timeout))
 
-    def list_sandboxes(self) -> list[Sandbox]:
+    def list_sandboxes(self, *, timeout: float | None = None) -> list[Sandbox]:
         """List all active sandboxes for the authenticated user.
 
+        Args:
+            timeout: Optional maximum seconds for the whole call,
+                including any hedged attempt.
+
         Raises:
-            Dev2CloudApiError: If the API returns an error response.
+            Dev2CloudApiError: If the API returns an error response or
+                the deadline is exceeded.
         """
-        response = self._client.get(self._sandboxes_path)
-        self._raise_on_error(response)
-        return [Sandbox(**item) for item in response.json()]
+        return self._list_sandboxes(self._deadline(timeout))
 
-    def delete_sandbox(self, sandbox_id: str) -> None:
+    def delete_sandbox(self, sandbox_id: str, *, timeout: float | None = None) -> None:
         """Permanently delete a sandbox.
 
         Connection credentials are revoked immediately.
 
         Args:
             sandbox_id: Unique identifier of the sandbox to delete.
+            timeout: Optional maximum seconds for the whole call.
 
         Raises:
-            Dev2CloudApiError: If the API returns an error response.
+            Dev2CloudApiError: If the API returns an error response or
+                the deadline is exceeded.
         """
-        response = self._client.delete(f"{self._sandboxes_path}/{sandbox_id}")
-        self._raise_on_error(response)
+        self._delete_sandbox(sandbox_id, self._deadline(timeout))
 
-    def delete_all(self) -> list[str]:
+    def delete_all(self, *, timeout: float | None = None) -> list[str]:
         """Delete all active sandboxes.
 
         Individual deletion errors are silently ignored so that one
         failure does not prevent the remaining sandboxes from being
         removed.
 
+        Args:
+            timeout: Optional maximum seconds for the whole call, shared
+                by the listing and every deletion.
+
         Returns:
             IDs of successfully deleted sandboxes.
+
+        Raises:
+            Dev2CloudApiError: If listing fails or the deadline is
+                exceeded before the listing completes.
         """
-        sandboxes = self.list_sandboxes()
+        deadline = self._deadline(timeout)
+        sandboxes = self._list_sandboxes(deadline)
         deleted: list[str] = []
         for sb in sandboxes:
             try:
-                self.delete_sandbox(sb.id)
+                self._delete_sandbox(sb.id, deadline)
                 deleted.append(sb.id)
             except Dev2CloudApiError:
                 pass
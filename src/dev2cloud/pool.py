@@ -0,0 +1,131 @@
+"""Run functions over a process pool where each worker owns a sandbox.
+
+Sandboxes are created up front in the parent process, handed out one per
+worker when the pool starts, and deleted once the pool shuts down, so
+workers pay neither client nor sandbox setup per task.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from multiprocessing.context import BaseContext
+from typing import Any, TypeVar
+
+from dev2cloud.client import Dev2Cloud
+from dev2cloud.exceptions import Dev2CloudApiError
+from dev2cloud.models import Sandbox, SandboxType
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_DELETE_TIMEOUT = 30
+
+_worker_client: Dev2Cloud | None = None
+_worker_sandbox: Sandbox | None = None
+
+
+def _init_worker(client: Dev2Cloud, sandboxes: Any) -> None:
+    global _worker_client, _worker_sandbox
+    _worker_client = client
+    _worker_sandbox = sandboxes.get()
+
+
+def _call(fn: Callable[[Dev2Cloud, Sandbox, T], R], item: T) -> R:
+    if _worker_client is None or _worker_sandbox is None:
+        raise RuntimeError("Worker was not initialised by map_with_sandboxes")
+    return fn(_worker_client, _worker_sandbox, item)
+
+
+def _delete_quietly(client: Dev2Cloud, sandboxes: Iterable[Sandbox]) -> None:
+    for sandbox in sandboxes:
+        try:
+            client.delete_sandbox(sandbox.id, timeout=_DELETE_TIMEOUT)
+        except Dev2CloudApiError:
+            pass
+
+
+def _create_sandboxes(
+    client: Dev2Cloud, sandbox_type: SandboxType, count: int, timeout: float
+) -> list[Sandbox]:
+    with ThreadPoolExecutor(max_workers=count) as threads:
+        futures = [
+            threads.submit(client.create_sandbox, sandbox_type, timeout=timeout)
+            for _ in range(count)
+        ]
+    created: list[Sandbox] = []
+    error: Exception | None = None
+    for future in futures:
+        try:
+            created.append(future.result())
+        except Exception as exc:
+            error = exc
+    if error is not None:
+        _delete_quietly(client, created)
+        raise error
+    return created
+
+
+def map_with_sandboxes(
+    client: Dev2Cloud,
+    fn: Callable[[Dev2Cloud, Sandbox, T], R],
+    items: Iterable[T],
+    *,
+    sandbox_type: SandboxType,
+    max_workers: int | None = None,
+    mp_context: BaseContext | None = None,
+    chunksize: int = 1,
+    timeout: float = 180,
+) -> list[R]:
+    """Call ``fn(client, sandbox, item)`` for every item in worker processes.
+
+    One sandbox per worker is provisioned concurrently before the pool
+    starts.  Each worker receives a copy of *client* and its own sandbox
+    once, at startup, and reuses both for every item it processes.  All
+    sandboxes are deleted when the pool shuts down, even if a task
+    raises; each deletion is bounded by a 30 second deadline.
+
+    *fn* must be picklable, i.e. defined at module level.
+
+    Args:
+        client: Client used to provision and delete the sandboxes; it is
+            also passed to the workers.
+        fn: Function called as ``fn(client, sandbox, item)``.
+        items: Inputs to map over.
+        sandbox_type: ``"postgres"`` or ``"redis"``.
+        max_workers: Number of worker processes (and sandboxes).
+            Defaults to the CPU count, capped at the number of items.
+        mp_context: Optional ``multiprocessing`` context for the pool.
+        chunksize: Items sent to a worker per task.
+        timeout: Maximum seconds to wait for each sandbox to provision.
+            Defaults to 180.
+
+    Returns:
+        Results in the order of *items*.
+
+    Raises:
+        Dev2CloudApiError: If a sandbox cannot be provisioned.
+    """
+    items = list(items)
+    if not items:
+        return []
+    workers = min(max_workers or os.cpu_count() or 1, len(items))
+
+    sandboxes = _create_sandboxes(client, sandbox_type, workers, timeout)
+    try:
+        context = mp_context or multiprocessing.get_context()
+        queue = context.Queue()
+        for sandbox in sandboxes:
+            queue.put(sandbox)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(client, queue),
+        ) as pool:
+            return list(pool.map(partial(_call, fn), items, chunksize=chunksize))
+    finally:
+        _delete_quietly(client, sandboxes)
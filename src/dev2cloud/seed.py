@@ -0,0 +1,320 @@
+"""Bulk data seeding for freshly provisioned sandboxes.
+
+Postgres tables are loaded with streamed ``COPY ... FROM STDIN`` (one
+connection per table, tables loaded in parallel) and Redis keys are
+written through non-transactional pipelines flushed in fixed-size
+chunks, so neither side ever holds the full dataset in memory.
+
+Both helpers accept either a :class:`~dev2cloud.models.Sandbox` or a
+plain connection URL, which makes them usable against local Postgres and
+Redis instances as well.
+
+Requires the optional ``psycopg`` (Postgres) and ``redis`` (Redis)
+packages::
+
+    pip install "dev2cloud[postgres,redis]"
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from pathlib import Path
+from typing import Any, Union
+
+from dev2cloud.models import Sandbox, SandboxStatus, SandboxType
+
+SeedSource = Union[str, "os.PathLike[str]", Iterable[Any]]
+"""A file path (``.csv``, ``.ndjson`` or ``.jsonl``) or an iterable of rows."""
+
+RedisSource = Union[
+    Mapping[str, Any], str, "os.PathLike[str]", Iterable["tuple[str, Any]"]
+]
+"""A key-to-value mapping, an NDJSON file path, or ``(key, value)`` pairs."""
+
+_CSV_CHUNK_BYTES = 1 << 20
+_NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+
+def _resolve_url(target: Sandbox | str, sandbox_type: SandboxType) -> str:
+    if not isinstance(target, Sandbox):
+        return str(target)
+    if target.sandbox_type != sandbox_type:
+        raise ValueError(
+            f"Sandbox {target.id} is a {target.sandbox_type.value} sandbox, "
+            f"expected {sandbox_type.value}"
+        )
+    if target.status != SandboxStatus.RUNNING or not target.url:
+        raise ValueError(f"Sandbox {target.id} is not running")
+    return target.url
+
+
+def _read_ndjson(path: Path) -> Iterator[Any]:
+    with open(path, encoding="utf-8-sig") as fh:
+        for line in fh:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+# --------------------------------------------------------------------------
+# Postgres
+# --------------------------------------------------------------------------
+
+
+def _import_psycopg() -> Any:
+    try:
+        import psycopg
+    except ImportError as exc:
+        raise ImportError(
+            "Postgres seeding requires psycopg. "
+            'Install it with `pip install "dev2cloud[postgres]"`.'
+        ) from exc
+    return psycopg
+
+
+def _copy_statement(table: str, columns: Sequence[str] | None, csv_format: bool) -> Any:
+    from psycopg import sql
+
+    query = sql.SQL("COPY {}").format(sql.Identifier(*table.split(".")))
+    if columns:
+        query += sql.SQL(" ({})").format(
+            sql.SQL(", ").join(sql.Identifier(column) for column in columns)
+        )
+    query += sql.SQL(" FROM STDIN")
+    if csv_format:
+        query += sql.SQL(" (FORMAT csv)")
+    return query
+
+
+def _adapt(value: Any) -> Any:
+    """Load nested objects and arrays of a mapping row as ``jsonb``."""
+    from psycopg.types.json import Jsonb
+
+    return Jsonb(value) if isinstance(value, (Mapping, list)) else value
+
+
+def _copy_csv(cursor: Any, table: str, path: Path, columns: Sequence[str] | None) -> int:
+    with open(path, "rb") as fh:
+        header = next(csv.reader([fh.readline().decode("utf-8-sig")]), [])
+        statement = _copy_statement(table, columns or header, csv_format=True)
+        with cursor.copy(statement) as copy:
+            while True:
+                chunk = fh.read(_CSV_CHUNK_BYTES)
+                if not chunk:
+                    break
+                copy.write(chunk)
+    return cursor.rowcount
+
+
+def _copy_rows(
+    cursor: Any, table: str, rows: Iterable[Any], columns: Sequence[str] | None
+) -> int:
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return 0
+
+    if isinstance(first, Mapping):
+        names = list(columns or first.keys())
+        values: Iterable[Sequence[Any]] = (
+            tuple(_adapt(row.get(name)) for name in names)
+            for row in chain([first], rows)
+        )
+    else:
+        names = list(columns) if columns else []
+        values = chain([first], rows)
+
+    with cursor.copy(_copy_statement(table, names, csv_format=False)) as copy:
+        for row in values:
+            copy.write_row(row)
+    return cursor.rowcount
+
+
+def _copy_table(
+    url: str, table: str, source: SeedSource, columns: Sequence[str] | None
+) -> int:
+    psycopg = _import_psycopg()
+    with psycopg.connect(url) as conn, conn.cursor() as cursor:
+        if not isinstance(source, (str, os.PathLike)):
+            return _copy_rows(cursor, table, source, columns)
+
+        path = Path(source)
+        suffix = path.suffix.lower()
+        if suffix == ".csv":
+            return _copy_csv(cursor, table, path, columns)
+        if suffix in _NDJSON_SUFFIXES:
+            return _copy_rows(cursor, table, _read_ndjson(path), columns)
+        raise ValueError(f"Unsupported seed file {path}: expected .csv, .ndjson or .jsonl")
+
+
+def seed_postgres(
+    target: Sandbox | str,
+    tables: Mapping[str, SeedSource],
+    *,
+    columns: Mapping[str, Sequence[str]] | None = None,
+    max_workers: int = 4,
+) -> dict[str, int]:
+    """Bulk-load rows into Postgres tables with ``COPY``.
+
+    Each table is streamed over its own connection and committed in its
+    own transaction; up to *max_workers* tables are loaded concurrently.
+    Tables that reference each other through foreign keys should be
+    seeded in separate calls, parents first.
+
+    A source may be:
+
+    * a ``.csv`` file whose first row is a header naming the columns,
+    * a ``.ndjson`` / ``.jsonl`` file with one JSON object per line,
+    * an iterable of dicts (columns taken from the first row's keys) or
+      of tuples (in table column order, or in the order given by
+      *columns*).
+
+    Nested dicts and lists in JSON objects and dict rows are loaded as
+    ``jsonb``.
+
+    Args:
+        target: A running Postgres sandbox or a ``postgresql://`` URL.
+        tables: Mapping of table name (optionally ``schema.table``) to
+            its source.
+        columns: Optional per-table column lists overriding the ones
+            inferred from the source.
+        max_workers: Maximum number of tables loaded at once.
+
+    Returns:
+        Number of rows loaded into each table.
+
+    Raises:
+        ImportError: If ``psycopg`` is not installed.
+        ValueError: If *target* is not a running Postgres sandbox or a
+            source file has an unsupported extension.
+    """
+    url = _resolve_url(target, SandboxType.POSTGRES)
+    _import_psycopg()
+    if not tables:
+        return {}
+
+    columns = columns or {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tables)))) as pool:
+        futures = {
+            table: pool.submit(_copy_table, url, table, source, columns.get(table))
+            for table, source in tables.items()
+        }
+        return {table: future.result() for table, future in futures.items()}
+
+
+# --------------------------------------------------------------------------
+# Redis
+# --------------------------------------------------------------------------
+
+
+def _import_redis() -> Any:
+    try:
+        import redis
+    except ImportError as exc:
+        raise ImportError(
+            "Redis seeding requires redis. "
+            'Install it with `pip install "dev2cloud[redis]"`.'
+        ) from exc
+    return redis
+
+
+def _iter_redis_items(
+    source: RedisSource,
+) -> Iterator[tuple[str, Any]]:
+    if isinstance(source, Mapping):
+        yield from source.items()
+    elif isinstance(source, (str, os.PathLike)):
+        path = Path(source)
+        if path.suffix.lower() not in _NDJSON_SUFFIXES:
+            raise ValueError(f"Unsupported seed file {path}: expected .ndjson or .jsonl")
+        for record in _read_ndjson(path):
+            yield record["key"], record["value"]
+    else:
+        yield from source
+
+
+def _queue_write(pipe: Any, key: str, value: Any, ttl: int | None) -> None:
+    if isinstance(value, (str, bytes, int, float)) and not isinstance(value, bool):
+        pipe.set(key, value, ex=ttl)
+        return
+    if not isinstance(value, (Mapping, list, tuple, set, frozenset)):
+        raise ValueError(
+            f"Unsupported value for key {key!r}: {type(value).__name__}"
+        )
+
+    pipe.delete(key)
+    if not value:
+        return
+    if isinstance(value, Mapping):
+        pipe.hset(key, mapping=value)
+    elif isinstance(value, (list, tuple)):
+        pipe.rpush(key, *value)
+    else:
+        pipe.sadd(key, *value)
+    if ttl is not None:
+        pipe.expire(key, ttl)
+
+
+def seed_redis(
+    target: Sandbox | str,
+    source: RedisSource,
+    *,
+    ttl: int | None = None,
+    chunk_size: int = 10_000,
+) -> int:
+    """Bulk-load keys into Redis through pipelined writes.
+
+    Commands are buffered in a non-transactional pipeline and flushed
+    every *chunk_size* keys, so large sources are streamed with bounded
+    memory and one round trip per chunk.
+
+    Values are written according to their type: mappings become hashes,
+    lists and tuples become lists, sets become sets and everything else
+    is stored with ``SET``.  Existing collection keys are replaced, and
+    an empty collection leaves its key deleted.
+
+    A source may be a mapping of key to value, an iterable of
+    ``(key, value)`` pairs, or a ``.ndjson`` / ``.jsonl`` file whose lines
+    are objects with ``"key"`` and ``"value"`` fields.
+
+    Args:
+        target: A running Redis sandbox or a ``redis://`` URL.
+        source: The keys to write.
+        ttl: Optional expiry in seconds applied to every key.
+        chunk_size: Number of keys sent per pipeline round trip.
+
+    Returns:
+        Number of keys written.
+
+    Raises:
+        ImportError: If ``redis`` is not installed.
+        ValueError: If *target* is not a running Redis sandbox, *ttl* or
+            *chunk_size* is not positive, a source file has an unsupported
+            extension, or a value has an unsupported type (e.g. ``None``
+            or ``bool``).
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if ttl is not None and ttl < 1:
+        raise ValueError("ttl must be at least 1 second")
+    url = _resolve_url(target, SandboxType.REDIS)
+    redis = _import_redis()
+
+    written = 0
+    client = redis.Redis.from_url(url)
+    try:
+        pipe = client.pipeline(transaction=False)
+        for key, value in _iter_redis_items(source):
+            _queue_write(pipe, key, value, ttl)
+            written += 1
+            if written % chunk_size == 0:
+                pipe.execute()
+        pipe.execute()
+    finally:
+        client.close()
+    return written
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import time
 import uuid
+from typing import AsyncIterator, Awaitable, Callable
 
+import httpx
 import pytest
 
 from dev2cloud.asyncio import Dev2Cloud as AsyncDev2Cloud
@@ -132,3 +136,138 @@ class TestClientInit:
     def test_explicit_api_key(self) -> None:
         c = AsyncDev2Cloud(api_key="d2c_test_dummy_key")
         assert c._client.headers["X-Api-Key"] == "d2c_test_dummy_key"
+
+
+def _mock_client(
+    handler: Callable[[httpx.Request], Awaitable[httpx.Response]], **kwargs: float
+) -> AsyncDev2Cloud:
+    c = AsyncDev2Cloud(api_key="d2c_test_dummy_key", **kwargs)
+    c._http = httpx.AsyncClient(
+        base_url="https://api.test", transport=httpx.MockTransport(handler)
+    )
+    return c
+
+
+def _prime(c: AsyncDev2Cloud, seconds: float = 0.01, endpoint: str = "list") -> None:
+    for _ in range(10):
+        c._latency[endpoint].record(seconds)
+
+
+class _DripStream(httpx.AsyncByteStream):
+    def __init__(self, body: bytes, interval: float) -> None:
+        self._body = body
+        self._interval = interval
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for i in range(len(self._body)):
+            await asyncio.sleep(self._interval)
+            yield self._body[i : i + 1]
+
+
+class TestDeadline:
+    async def test_slow_body_cannot_outlive_deadline(self) -> None:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, stream=_DripStream(b"[]" * 10, 0.3))
+
+        c = _mock_client(handler)
+        start = time.monotonic()
+        with pytest.raises(Dev2CloudApiError, match="Deadline exceeded"):
+            await c.list_sandboxes(timeout=1.0)
+        assert time.monotonic() - start < 1.3
+
+    async def test_create_polls_within_deadline(self) -> None:
+        pending = {"id": "sb-1", "sandbox_type": "postgres", "status": "pending"}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=pending)
+
+        c = _mock_client(handler)
+        start = time.monotonic()
+        with pytest.raises(Dev2CloudApiError, match="did not become ready"):
+            await c.create_sandbox(SandboxType.POSTGRES, timeout=1.5)
+        assert time.monotonic() - start < 1.8
+
+    async def test_read_within_deadline(self, async_client: AsyncDev2Cloud) -> None:
+        assert isinstance(await async_client.list_sandboxes(timeout=30), list)
+
+
+class TestHedging:
+    async def test_stalled_read_is_hedged_and_loser_cancelled(self) -> None:
+        calls = []
+        cancelled = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            if len(calls) == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return httpx.Response(200, json=[])
+
+        c = _mock_client(handler, hedge_percentile=0.9)
+        _prime(c)
+        start = time.monotonic()
+        assert await c.list_sandboxes(timeout=5) == []
+        assert time.monotonic() - start < 1
+        assert len(calls) == 2
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+    async def test_failed_first_attempt_falls_back_to_hedge(self) -> None:
+        calls = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            if len(calls) == 1:
+                await asyncio.sleep(0.2)
+                raise httpx.ConnectError("boom", request=request)
+            await asyncio.sleep(0.4)
+            return httpx.Response(200, json=[])
+
+        c = _mock_client(handler, hedge_percentile=0.9)
+        _prime(c)
+        assert await c.list_sandboxes(timeout=5) == []
+        assert len(calls) == 2
+
+    async def test_fast_read_is_not_hedged(self) -> None:
+        calls = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json=[])
+
+        c = _mock_client(handler, hedge_percentile=0.9)
+        _prime(c, seconds=1.0)
+        assert await c.list_sandboxes() == []
+        assert len(calls) == 1
+
+    async def test_latency_is_tracked_per_endpoint(self) -> None:
+        calls = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            await asyncio.sleep(0.2)
+            return httpx.Response(200, json=[])
+
+        c = _mock_client(handler, hedge_percentile=0.9)
+        _prime(c, seconds=0.01, endpoint="get")
+        _prime(c, seconds=0.5, endpoint="list")
+        assert await c.list_sandboxes() == []
+        assert len(calls) == 1
+
+    async def test_hedged_reads_respect_deadline(self) -> None:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(5)
+            return httpx.Response(200, json=[])
+
+        c = _mock_client(handler, hedge_percentile=0.9)
+        _prime(c)
+        start = time.monotonic()
+        with pytest.raises(Dev2CloudApiError, match="Deadline exceeded"):
+            await c.list_sandboxes(timeout=0.5)
+        assert time.monotonic() - start < 0.8
+
+    def test_invalid_percentile_raises(self) -> None:
+        with pytest.raises(ValueError, match="hedge_percentile"):
+            AsyncDev2Cloud(api_key="d2c_test_dummy_key", hedge_percentile=95)
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import pickle
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+
+import httpx
+import pytest
+
+import dev2cloud.client
+from dev2cloud import pool
+from dev2cloud.client import Dev2Cloud
+from dev2cloud.exceptions import Dev2CloudApiError
+from dev2cloud.models import Sandbox, SandboxType
+from dev2cloud.pool import map_with_sandboxes
+
+
+def _describe(client: Dev2Cloud, sandbox: Sandbox, item: int) -> tuple[int, str, int]:
+    return os.getpid(), sandbox.id, item * 2
+
+
+def _fetch(client: Dev2Cloud, sandbox: Sandbox, item: int) -> tuple[int, str, int]:
+    assert client.get_sandbox(sandbox.id).id == sandbox.id
+    return os.getpid(), sandbox.id, item * 2
+
+
+def _fail_on_three(client: Dev2Cloud, sandbox: Sandbox, item: int) -> int:
+    if item == 3:
+        raise ValueError("task failed")
+    return item
+
+
+class _LocalApi:
+    """In-memory stand-in for the sandbox API, reachable from worker processes."""
+
+    def __init__(self) -> None:
+        self.sandboxes: dict[str, dict[str, Any]] = {}
+        self.deleted: list[str] = []
+        self.creates = 0
+        self.fail_create_at: int | None = None
+        self.lock = threading.Lock()
+
+
+def _handler_for(api: _LocalApi) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def _reply(self, status: int, body: Any = None) -> None:
+            data = b"" if body is None else json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_POST(self) -> None:
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            with api.lock:
+                api.creates += 1
+                if api.creates == api.fail_create_at:
+                    return self._reply(500, {"detail": "provision failed"})
+                sandbox = {
+                    "id": f"sb-{api.creates}",
+                    "sandbox_type": payload["sandbox_type"],
+                    "status": "running",
+                    "credentials": {"password": "p", "host": "127.0.0.1"},
+                }
+                api.sandboxes[sandbox["id"]] = sandbox
+            self._reply(200, sandbox)
+
+        def do_GET(self) -> None:
+            if self.path == "/api/v1/sandboxes":
+                return self._reply(200, list(api.sandboxes.values()))
+            sandbox = api.sandboxes.get(self.path.rsplit("/", 1)[-1])
+            if sandbox is None:
+                return self._reply(404, {"detail": "Sandbox not found"})
+            self._reply(200, sandbox)
+
+        def do_DELETE(self) -> None:
+            sandbox_id = self.path.rsplit("/", 1)[-1]
+            with api.lock:
+                if api.sandboxes.pop(sandbox_id, None) is None:
+                    return self._reply(404, {"detail": "Sandbox not found"})
+                api.deleted.append(sandbox_id)
+            self._reply(204)
+
+    return Handler
+
+
+@pytest.fixture
+def local_api() -> Iterator[tuple[_LocalApi, Dev2Cloud]]:
+    api = _LocalApi()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler_for(api))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        host, port = server.server_address[:2]
+        yield api, Dev2Cloud(api_key="d2c_test_dummy_key", base_url=f"http://{host}:{port}")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+_START_METHODS = [
+    method
+    for method in ("fork", "spawn", "forkserver")
+    if method in multiprocessing.get_all_start_methods()
+]
+
+
+_inherited_client: Dev2Cloud | None = None
+
+
+def _count_sandboxes(_: int) -> int:
+    assert _inherited_client is not None
+    return len(_inherited_client.list_sandboxes())
+
+
+class TestForkSafety:
+    def test_pickle_keeps_configuration_only(self) -> None:
+        client = Dev2Cloud(api_key="d2c_test_dummy_key", hedge_percentile=0.9)
+        transport = client._client
+        restored = pickle.loads(pickle.dumps(client))
+        assert restored._client is not transport
+        assert restored._client.headers["X-Api-Key"] == "d2c_test_dummy_key"
+        assert restored._hedge_percentile == 0.9
+
+    def test_transport_created_once_across_threads(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        created = []
+        real_client = httpx.Client
+
+        def slow_client(*args: Any, **kwargs: Any) -> httpx.Client:
+            time.sleep(0.01)
+            created.append(real_client(*args, **kwargs))
+            return created[-1]
+
+        monkeypatch.setattr(dev2cloud.client.httpx, "Client", slow_client)
+        client = pickle.loads(pickle.dumps(Dev2Cloud(api_key="d2c_test_dummy_key")))
+        with ThreadPoolExecutor(max_workers=8) as threads:
+            transports = list(threads.map(lambda _: client._client, range(8)))
+        assert len(created) == 1
+        assert all(t is created[0] for t in transports)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="fork is unavailable")
+    def test_client_used_before_fork(
+        self, client: Dev2Cloud, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(sys.modules[__name__], "_inherited_client", client)
+        expected = len(client.list_sandboxes())
+        context = multiprocessing.get_context("fork")
+        with context.Pool(2) as pool:
+            assert pool.map(_count_sandboxes, range(2)) == [expected] * 2
+        assert len(client.list_sandboxes()) == expected
+
+
+class TestMapWithSandboxes:
+    def test_call_outside_initialised_worker_raises(self) -> None:
+        with pytest.raises(RuntimeError, match="not initialised"):
+            pool._call(_describe, 1)
+
+    @pytest.mark.parametrize("start_method", _START_METHODS)
+    def test_each_worker_gets_own_local_sandbox(
+        self, local_api: tuple[_LocalApi, Dev2Cloud], start_method: str
+    ) -> None:
+        api, client = local_api
+        results = map_with_sandboxes(
+            client,
+            _fetch,
+            range(6),
+            sandbox_type=SandboxType.REDIS,
+            max_workers=2,
+            mp_context=multiprocessing.get_context(start_method),
+        )
+        assert [doubled for _, _, doubled in results] == [0, 2, 4, 6, 8, 10]
+
+        sandbox_by_pid: dict[int, str] = {}
+        for pid, sandbox_id, _ in results:
+            assert sandbox_by_pid.setdefault(pid, sandbox_id) == sandbox_id
+        assert len(set(sandbox_by_pid.values())) == len(sandbox_by_pid)
+        assert api.sandboxes == {}
+        assert sorted(api.deleted) == ["sb-1", "sb-2"]
+
+    def test_failing_task_still_deletes_sandboxes(
+        self, local_api: tuple[_LocalApi, Dev2Cloud]
+    ) -> None:
+        api, client = local_api
+        with pytest.raises(ValueError, match="task failed"):
+            map_with_sandboxes(
+                client,
+                _fail_on_three,
+                range(6),
+                sandbox_type=SandboxType.REDIS,
+                max_workers=2,
+            )
+        assert api.sandboxes == {}
+        assert len(api.deleted) == 2
+
+    def test_provisioning_failure_rolls_back(
+        self, local_api: tuple[_LocalApi, Dev2Cloud]
+    ) -> None:
+        api, client = local_api
+        api.fail_create_at = 2
+        with pytest.raises(Dev2CloudApiError, match="provision failed"):
+            map_with_sandboxes(
+                client,
+                _describe,
+                range(6),
+                sandbox_type=SandboxType.REDIS,
+                max_workers=3,
+            )
+        assert api.creates == 3
+        assert api.sandboxes == {}
+        assert len(api.deleted) == 2
+
+    def test_each_worker_gets_own_sandbox(self, client: Dev2Cloud) -> None:
+        results = map_with_sandboxes(
+            client,
+            _describe,
+            range(6),
+            sandbox_type=SandboxType.REDIS,
+            max_workers=2,
+        )
+        assert [doubled for _, _, doubled in results] == [0, 2, 4, 6, 8, 10]
+
+        sandbox_by_pid = {}
+        for pid, sandbox_id, _ in results:
+            assert sandbox_by_pid.setdefault(pid, sandbox_id) == sandbox_id
+        assert len(set(sandbox_by_pid.values())) == len(sandbox_by_pid)
+
+        remaining = {s.id for s in client.list_sandboxes()}
+        assert remaining.isdisjoint(sandbox_by_pid.values())
+
+    def test_empty_items(self) -> None:
+        client = Dev2Cloud(api_key="d2c_test_dummy_key")
+        assert map_with_sandboxes(
+            client, _describe, [], sandbox_type=SandboxType.REDIS
+        ) == []
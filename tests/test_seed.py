@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from dev2cloud.models import Sandbox, SandboxType
+from dev2cloud.seed import seed_postgres, seed_redis
+
+psycopg = pytest.importorskip("psycopg")
+redis = pytest.importorskip("redis")
+
+
+@pytest.fixture
+def postgres_url() -> Iterator[str]:
+    """A local Postgres stand-in, e.g. ``postgresql://postgres@localhost/test``."""
+    url = os.environ.get("D2C_TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("D2C_TEST_POSTGRES_URL not set — skipping Postgres seeding tests")
+    with psycopg.connect(url) as conn:
+        conn.execute("DROP TABLE IF EXISTS users, events, documents")
+        conn.execute("CREATE TABLE users (id int PRIMARY KEY, name text)")
+        conn.execute("CREATE TABLE events (user_id int, kind text)")
+        conn.execute("CREATE TABLE documents (id int, body jsonb)")
+    try:
+        yield url
+    finally:
+        with psycopg.connect(url) as conn:
+            conn.execute("DROP TABLE IF EXISTS users, events, documents")
+
+
+@pytest.fixture
+def redis_url() -> Iterator[str]:
+    """A local Redis stand-in, e.g. ``redis://localhost:6379/15``."""
+    url = os.environ.get("D2C_TEST_REDIS_URL")
+    if not url:
+        pytest.skip("D2C_TEST_REDIS_URL not set — skipping Redis seeding tests")
+    r = redis.Redis.from_url(url, decode_responses=True)
+    try:
+        r.flushdb()
+        yield url
+        r.flushdb()
+    finally:
+        r.close()
+
+
+@pytest.fixture
+def redis_conn(redis_url: str) -> Iterator[redis.Redis]:
+    r = redis.Redis.from_url(redis_url, decode_responses=True)
+    try:
+        yield r
+    finally:
+        r.close()
+
+
+def _count(url: str, table: str) -> int:
+    with psycopg.connect(url) as conn:
+        return conn.execute(f"SELECT count(*) FROM {table}").fetchone()[0]
+
+
+def _sandbox(sandbox_type: SandboxType, status: str = "running") -> Sandbox:
+    return Sandbox(
+        id="sb-local",
+        sandbox_type=sandbox_type,
+        status=status,
+        credentials={"user": "u", "password": "p", "host": "localhost"},
+    )
+
+
+class TestSeedPostgres:
+    def test_seed_from_iterables(self, postgres_url: str) -> None:
+        loaded = seed_postgres(
+            postgres_url,
+            {
+                "users": ({"id": i, "name": f"user-{i}"} for i in range(1000)),
+                "events": [(i % 10, "login") for i in range(500)],
+            },
+        )
+        assert loaded == {"users": 1000, "events": 500}
+        assert _count(postgres_url, "users") == 1000
+        assert _count(postgres_url, "events") == 500
+
+    def test_seed_from_files(self, postgres_url: str, tmp_path: Path) -> None:
+        users = tmp_path / "users.csv"
+        users.write_text("\ufeffname,id\nalice,1\nbob,2\n", encoding="utf-8")
+        events = tmp_path / "events.ndjson"
+        events.write_text(
+            "\n".join(json.dumps({"user_id": 1, "kind": "login"}) for _ in range(3))
+        )
+
+        loaded = seed_postgres(postgres_url, {"users": users, "events": str(events)})
+        assert loaded == {"users": 2, "events": 3}
+        with psycopg.connect(postgres_url) as conn:
+            row = conn.execute("SELECT name FROM users WHERE id = 2").fetchone()
+        assert row[0] == "bob"
+
+    def test_ndjson_nested_values_load_as_jsonb(
+        self, postgres_url: str, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "documents.jsonl"
+        path.write_text(
+            json.dumps({"id": 1, "body": {"tags": ["a", "b"]}})
+            + "\n"
+            + json.dumps({"id": 2, "body": [1, 2, 3]})
+        )
+
+        assert seed_postgres(postgres_url, {"documents": path}) == {"documents": 2}
+        with psycopg.connect(postgres_url) as conn:
+            rows = conn.execute("SELECT body FROM documents ORDER BY id").fetchall()
+        assert [body for (body,) in rows] == [{"tags": ["a", "b"]}, [1, 2, 3]]
+
+    def test_dict_rows_nested_values_load_as_jsonb(self, postgres_url: str) -> None:
+        rows = [{"id": 1, "body": {"a": 1}}, {"id": 2, "body": ["x"]}]
+
+        assert seed_postgres(postgres_url, {"documents": rows}) == {"documents": 2}
+        with psycopg.connect(postgres_url) as conn:
+            bodies = conn.execute("SELECT body FROM documents ORDER BY id").fetchall()
+        assert [body for (body,) in bodies] == [{"a": 1}, ["x"]]
+
+    def test_wrong_sandbox_type_raises(self) -> None:
+        with pytest.raises(ValueError, match="expected postgres"):
+            seed_postgres(_sandbox(SandboxType.REDIS), {"users": []})
+
+    def test_pending_sandbox_raises(self) -> None:
+        with pytest.raises(ValueError, match="not running"):
+            seed_postgres(_sandbox(SandboxType.POSTGRES, "pending"), {"users": []})
+
+
+class TestSeedRedis:
+    def test_seed_from_mapping(self, redis_url: str, redis_conn: redis.Redis) -> None:
+        source = {f"key:{i}": str(i) for i in range(2500)}
+        source["hash"] = {"a": "1", "b": "2"}
+        source["list"] = ["x", "y", "z"]
+
+        written = seed_redis(redis_url, source, chunk_size=1000)
+        assert written == 2502
+        assert redis_conn.get("key:2499") == "2499"
+        assert redis_conn.hgetall("hash") == {"a": "1", "b": "2"}
+        assert redis_conn.lrange("list", 0, -1) == ["x", "y", "z"]
+
+    def test_seed_from_file_with_ttl(
+        self, redis_url: str, redis_conn: redis.Redis, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "keys.jsonl"
+        path.write_text(
+            "\n".join(json.dumps({"key": f"k{i}", "value": i}) for i in range(10))
+        )
+
+        assert seed_redis(redis_url, path, ttl=300) == 10
+        assert redis_conn.get("k9") == "9"
+        assert 0 < redis_conn.ttl("k9") <= 300
+
+    def test_empty_collections_delete_key(
+        self, redis_url: str, redis_conn: redis.Redis
+    ) -> None:
+        redis_conn.hset("hash", mapping={"stale": "1"})
+        redis_conn.rpush("list", "stale")
+        redis_conn.sadd("set", "stale")
+
+        written = seed_redis(
+            redis_url, {"hash": {}, "list": [], "set": set(), "after": "ok"}
+        )
+        assert written == 4
+        assert redis_conn.exists("hash", "list", "set") == 0
+        assert redis_conn.get("after") == "ok"
+
+    @pytest.mark.parametrize("value", [None, True])
+    def test_unsupported_value_raises(self, redis_url: str, value: object) -> None:
+        with pytest.raises(ValueError, match="'bad'"):
+            seed_redis(redis_url, {"bad": value})
+
+    def test_wrong_sandbox_type_raises(self) -> None:
+        with pytest.raises(ValueError, match="expected redis"):
+            seed_redis(_sandbox(SandboxType.POSTGRES), {})
+
+    @pytest.mark.parametrize("ttl", [0, -5])
+    def test_non_positive_ttl_raises(self, ttl: int) -> None:
+        with pytest.raises(ValueError, match="ttl"):
+            seed_redis("redis://localhost:6379/0", {"key": "value"}, ttl=ttl)
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator
 
+import httpx
 import pytest
 
 from dev2cloud.client import Dev2Cloud
@@ -126,3 +131,151 @@ class TestClientInit:
     def test_explicit_api_key(self) -> None:
         c = Dev2Cloud(api_key="d2c_test_dummy_key")
         assert c._client.headers["X-Api-Key"] == "d2c_test_dummy_key"
+
+
+def _mock_client(
+    handler: Callable[[httpx.Request], httpx.Response], **kwargs: float
+) -> Dev2Cloud:
+    c = Dev2Cloud(api_key="d2c_test_dummy_key", **kwargs)
+    c._http = httpx.Client(
+        base_url="https://api.test", transport=httpx.MockTransport(handler)
+    )
+    return c
+
+
+def _prime(c: Dev2Cloud, seconds: float = 0.01, endpoint: str = "list") -> None:
+    for _ in range(10):
+        c._latency[endpoint].record(seconds)
+
+
+class _DripStream(httpx.SyncByteStream):
+    def __init__(self, body: bytes, interval: float) -> None:
+        self._body = body
+        self._interval = interval
+
+    def __iter__(self) -> Iterator[bytes]:
+        for i in range(len(self._body)):
+            time.sleep(self._interval)
+            yield self._body[i : i + 1]
+
+
+class TestDeadline:
+    def test_slow_body_cannot_outlive_deadline(self) -> None:
+        c = _mock_client(
+            lambda request: httpx.Response(200, stream=_DripStream(b"[]" * 10, 0.3))
+        )
+        start = time.monotonic()
+        with pytest.raises(Dev2CloudApiError, match="Deadline exceeded"):
+            c.list_sandboxes(timeout=1.0)
+        assert time.monotonic() - start < 1.3
+
+    def test_create_polls_within_deadline(self) -> None:
+        pending = {"id": "sb-1", "sandbox_type": "postgres", "status": "pending"}
+        c = _mock_client(lambda request: httpx.Response(200, json=pending))
+        start = time.monotonic()
+        with pytest.raises(Dev2CloudApiError, match="did not become ready"):
+            c.create_sandbox(SandboxType.POSTGRES, timeout=1.5)
+        assert time.monotonic() - start < 1.8
+
+    def test_concurrent_callers_do_not_queue(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            time.sleep(0.5)
+            return httpx.Response(200, json=[])
+
+        c = _mock_client(handler)
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=40) as callers:
+            results = list(
+                callers.map(lambda _: c.list_sandboxes(timeout=1.2), range(40))
+            )
+        assert results == [[]] * 40
+        assert time.monotonic() - start < 1.2
+
+    def test_read_within_deadline(self, client: Dev2Cloud) -> None:
+        assert isinstance(client.list_sandboxes(timeout=30), list)
+
+
+class TestHedging:
+    def test_stalled_read_is_hedged(self) -> None:
+        release = threading.Event()
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            if len(calls) == 1:
+                release.wait(5)
+                return httpx.Response(500, json={"detail": "stalled"})
+            return httpx.Response(200, json=[])
+
+        c = _mock_client(handler, hedge_percentile=0.9)
+        _prime(c)
+        start = time.monotonic()
+        try:
+            assert c.list_sandboxes(timeout=5) == []
+            assert time.monotonic() - start < 1
+            assert len(calls) == 2
+        finally:
+            release.set()
+
+    def test_failed_first_attempt_falls_back_to_hedge(self) -> None:
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            if len(calls) == 1:
+                time.sleep(0.2)
+                raise httpx.ConnectError("boom", request=request)
+            time.sleep(0.4)
+            return httpx.Response(200, json=[])
+
+        c = _mock_client(handler, hedge_percentile=0.9)
+        _prime(c)
+        assert c.list_sandboxes(timeout=5) == []
+        assert len(calls) == 2
+
+    def test_fast_read_is_not_hedged(self) -> None:
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json=[])
+
+        c = _mock_client(handler, hedge_percentile=0.9)
+        _prime(c, seconds=1.0)
+        assert c.list_sandboxes() == []
+        assert len(calls) == 1
+
+    def test_latency_is_tracked_per_endpoint(self) -> None:
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            time.sleep(0.2)
+            return httpx.Response(200, json=[])
+
+        c = _mock_client(handler, hedge_percentile=0.9)
+        _prime(c, seconds=0.01, endpoint="get")
+        _prime(c, seconds=0.5, endpoint="list")
+        assert c.list_sandboxes() == []
+        assert len(calls) == 1
+
+    def test_hedged_reads_respect_deadline(self) -> None:
+        release = threading.Event()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            release.wait(5)
+            return httpx.Response(200, json=[])
+
+        c = _mock_client(handler, hedge_percentile=0.9)
+        _prime(c)
+        start = time.monotonic()
+        try:
+            with pytest.raises(Dev2CloudApiError, match="Deadline exceeded"):
+                c.list_sandboxes(timeout=0.5)
+            assert time.monotonic() - start < 0.8
+        finally:
+            release.set()
+
+    def test_invalid_percentile_raises(self) -> None:
+        with pytest.raises(ValueError, match="hedge_percentile"):
+            Dev2Cloud(api_key="d2c_test_dummy_key", hedge_percentile=95)